@@ -9,12 +9,12 @@ import time
 import datetime
 import os
 from dataclasses import dataclass
-import threading
 import struct
 from typing import Final, Tuple, Callable, Optional, List
 from enum import Enum, auto
 import shutil
 import math
+import mmap
 
 
 CURRENT_VERSION = '2025.04.24'
@@ -44,15 +44,19 @@ RESET: Final     = '\x1b[0m'  # Resets all text styles and colors
 PL: Final = '\x1b[F'  # Move cursor to previous line
 CL: Final = '\x1b[K'  # Clear line
 
-# Spinner frames for the parsing spinner
-SPINNER_FRAMES: Final = [
-    "⢀⠀", "⡀⠀", "⠄⠀", "⢂⠀", "⡂⠀", "⠅⠀", "⢃⠀", "⡃⠀", "⠍⠀", "⢋⠀",
-    "⡋⠀", "⠍⠁", "⢋⠁", "⡋⠁", "⠍⠉", "⠋⠉", "⠋⠉", "⠉⠙", "⠉⠙", "⠉⠩",
-    "⠈⢙", "⠈⡙", "⢈⠩", "⡀⢙", "⠄⡙", "⢂⠩", "⡂⢘", "⠅⡘", "⢃⠨", "⡃⢐",
-    "⠍⡐", "⢋⠠", "⡋⢀", "⠍⡁", "⢋⠁", "⡋⠁", "⠍⠉", "⠋⠉", "⠋⠉", "⠉⠙",
-    "⠉⠙", "⠉⠩", "⠈⢙", "⠈⡙", "⠈⠩", "⠀⢙", "⠀⡙", "⠀⠩", "⠀⢘", "⠀⡘",
-    "⠀⠨", "⠀⢐", "⠀⡐", "⠀⠠", "⠀⢀", "⠀⡀",
-]
+# Precompiled layouts for the sequence message readers
+STRUCT_U8_U16: Final = struct.Struct('>1B1H')
+STRUCT_S16_U8: Final = struct.Struct('>1H1B')
+
+# Printf-style formats for message arguments, keyed by argument size
+ARG_FORMATS: Final = {
+    'u8':  ' %02X',
+    'u16': ' %04X',
+    's16': ' %04X',
+}
+
+# Single-byte values for every possible volume, so edits do not build new bytes objects
+BYTE_VALUES: Final = [bytes((i,)) for i in range(0x100)]
 
 FILE_EXT: Final = [
     # Standalone sequences
@@ -70,22 +74,25 @@ class SeqVersion(Enum):
 GAME_VERSION: Final = (SeqVersion.OOT, SeqVersion.MM)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageData:
     arg_addr_1: Optional[int] = None
     arg_addr_2: Optional[int] = None
-    msg_byte: int = 0xFF
     arg_1: Optional[Tuple[int, str]] = None
     arg_2: Optional[Tuple[int, str]] = None
     pos: int = 2
 
 
-# Output messages
-SEQ_HEADER_OUTPUT: list[str] = []
+# Parsed messages as (opcode, address, arg 1, arg 2), formatted only when printed
+SEQ_HEADER_OUTPUT: list[tuple[int, int, Optional[Tuple[int, str]], Optional[Tuple[int, str]]]] = []
 
 # Master Volume (SysEx) Addresses
 MSTR_VOL_ADDR: list[int] = []
 
+# Replacement messages for conditional jumps
+JUMP_MSG: Final  = b'\xFB'
+RJUMP_MSG: Final = b'\xF4'
+
 # ABS Jump Addresses
 JUMP_ADDR: list[int] = []
 EQJUMP_ADDR: list[int] = []
@@ -98,23 +105,7 @@ REQJUMP_ADDR: list[int] = []
 RLTJUMP_ADDR: list[int] = []
 
 
-def start_thread(thread: threading.Thread, msg_type: str, start_msg: str, end_msg: str) -> None:
-    """ Creates a thread to indicate that a process is ongoing """
-
-    thread.start()
-    i = 0
-
-    print(msg_type)
-    while thread.is_alive():
-        print(f'  {GREEN_79}{SPINNER_FRAMES[i]}{RESET}', start_msg, end='\r', flush=True)
-        i = (i + 1) % len(SPINNER_FRAMES)
-        time.sleep(0.045)
-
-    thread.join()
-    print(f'{CL}', end_msg)
-
-
-def seq_parse_output(list):
+def seq_parse_output(list, animate: bool = False):
     """ Creates a formatted message string for printing sequence messages to console """
 
     start = f'''
@@ -123,11 +114,20 @@ def seq_parse_output(list):
   {ITALIC}{BLUE_39}COMMAND         @ADDR: DATA{RESET}'''
     end = f'''  {BOLD}{RED}[   END SEQ SECTION   ]{RESET}'''
 
-    print(start)
-    for entry in list:
-        print(entry)
-        time.sleep(0.025)
-    print(end)
+    lines = [
+        MSG_PREFIXES[opcode] + get_msg_string(addr, opcode, arg_1, arg_2) + MSG_SUFFIXES[opcode]
+        for opcode, addr, arg_1, arg_2 in list
+    ]
+
+    if animate:
+        print(start)
+        for line in lines:
+            print(line)
+            time.sleep(0.025)
+        print(end)
+    else:
+        sys.stdout.write('\n'.join((start, *lines, end)) + '\n')
+        sys.stdout.flush()
 
 
 def format_addr(addr: int) -> str:
@@ -135,135 +135,121 @@ def format_addr(addr: int) -> str:
 
 
 def format_args(args: Tuple[Optional[Tuple[int, str]], ...]) -> str:
-    return ' '.join(
-        f'{val:04X}' if size in ('u16', 's16') else f'{val:02X}'
+    return ''.join(
+        ARG_FORMATS[size] % val
         for arg in args if arg is not None
         for val, size in [arg]
     )
 
 
-def get_msg_string(addr: int, msg: int | None, *args: int) -> str:
+def get_msg_string(addr: int, msg: int, *args: int) -> str:
     """ Creates a formatted message string for printing sequence messages to console """
-    if msg is None:
-        return '  unk_msg           @???? ?? ?? ??'
-
-    hex_addr = format_addr(addr)
-    hex_msg = f'{msg:02X}'
-    hex_args = format_args(args)
-
-    spacing = ' ' if hex_args else ''
-    return f'{hex_addr}: {hex_msg}{spacing}{hex_args}'.upper()
+    return '%s: %02X%s' % (format_addr(addr), msg, format_args(args))
 
 
-def seek_addr(seq: str, addr: int):
-    """ Seeks the byte at the specified address """
+def get_vol_success_string(addr: int, vol: int) -> str:
+    """ Creates a formatted message string for a successfully changed master volume message """
+    return f'\n{BOLD}{GREEN_79}[SUCCESS]{RESET}:\n  Master volume at {PINK_218}{format_addr(addr)}{RESET} successfully changed to: {PINK_218}{vol}{RESET} ({PINK_218}0x{vol:X}{RESET})'
 
-    seq.seek(addr)
 
-
-def read_msg(seq: str, offset: int) -> Tuple[int]:
+def read_msg(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with no args """
 
-    seek_addr(seq, offset)
+    return MessageData()
+
 
-    data = struct.unpack('>1B', seq.read(1))
+def read_unk(buf: mmap.mmap, offset: int) -> MessageData:
+    """ Reads a sequence message whose argument layout is unknown """
 
-    return MessageData(msg_byte=data[0])
+    return MessageData()
 
 
-def read_argvar(seq: str, offset: int, arglen: str) -> Tuple[int, int, int]:
+def read_argvar(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with a variable argument length """
 
-    seek_addr(seq, offset)
-    arg_addr = seq.tell() + 1
+    arg_addr = offset + 1
+    arglen = buf[arg_addr]
 
     if arglen & 0x80:
-        data = struct.unpack('>1B1H', seq.read(3))
-        return MessageData(arg_addr_1=arg_addr, msg_byte=data[0], arg_1=(data[1], 'u16'), pos=3)
+        arg = ((arglen & 0x7F) << 8) | buf[offset + 2]
+        return MessageData(arg_addr_1=arg_addr, arg_1=(arg, 'u16'), pos=3)
 
     else:
-        data = struct.unpack('>2B', seq.read(2))
-        return MessageData(arg_addr_1=arg_addr, msg_byte=data[0], arg_1=(data[1], 'u8'))
+        return MessageData(arg_addr_1=arg_addr, arg_1=(arglen, 'u8'))
 
 
-def read_u8(seq: str, offset: int) -> Tuple[int, int, int]:
+def read_u8(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with one u8 argument """
 
-    seek_addr(seq, offset)
-    arg_addr = seq.tell() + 1
-
-    data = struct.unpack('>2B', seq.read(2))
+    arg_addr = offset + 1
 
-    return MessageData(arg_addr_1=arg_addr, msg_byte=data[0], arg_1=(data[1], 'u8'))
+    return MessageData(arg_addr_1=arg_addr, arg_1=(buf[arg_addr], 'u8'))
 
 
-def read_u8x2(seq: str, offset: int) -> Tuple[int, int, int, int, int]:
+def read_u8x2(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with two u8 arguments """
 
-    seek_addr(seq, offset)
-    arg_addr1 = seq.tell() + 1
-    arg_addr2 = seq.tell() + 2
+    arg_addr1 = offset + 1
+    arg_addr2 = offset + 2
 
-    data = struct.unpack('>3B', seq.read(3))
+    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, arg_1=(buf[arg_addr1], 'u8'), arg_2=(buf[arg_addr2], 'u8'))
 
-    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, msg_byte=data[0], arg_1=(data[1], 'u8'), arg_2=(data[2], 'u8'))
 
-
-def read_u8_u16(seq: str, offset: int) -> Tuple[int, int, int, int, int]:
+def read_u8_u16(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with one u8 argument and one u16 argument """
 
-    seek_addr(seq, offset)
-    arg_addr1 = seq.tell() + 1
-    arg_addr2 = seq.tell() + 2
+    arg_addr1 = offset + 1
+    arg_addr2 = offset + 2
 
-    data = struct.unpack('>2B1H', seq.read(4))
+    data = STRUCT_U8_U16.unpack_from(buf, arg_addr1)
 
-    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, msg_byte=data[0], arg_1=(data[1], 'u8'), arg_2=(data[2], 'u16'))
+    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, arg_1=(data[0], 'u8'), arg_2=(data[1], 'u16'))
 
 
-def read_u16(seq: str, offset: int) -> Tuple[int, int, int]:
+def read_u16(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with one u16 argument """
 
-    seek_addr(seq, offset)
-    arg_addr = seq.tell() + 1
-
-    data = struct.unpack('>1B1H', seq.read(3))
+    arg_addr = offset + 1
+    arg = (buf[arg_addr] << 8) | buf[arg_addr + 1]
 
-    return MessageData(arg_addr_1=arg_addr, msg_byte=data[0], arg_1=(data[1], 'u16'))
+    return MessageData(arg_addr_1=arg_addr, arg_1=(arg, 'u16'))
 
 
-def read_s16_u8(seq: str, offset: int) -> Tuple[int, int, int, int, int]:
+def read_s16_u8(buf: mmap.mmap, offset: int) -> MessageData:
     """ Reads a sequence message with one s16 argument and one u8 argument """
 
-    seek_addr(seq, offset)
-    arg_addr1 = seq.tell() + 1
-    arg_addr2 = seq.tell() + 3
+    arg_addr1 = offset + 1
+    arg_addr2 = offset + 3
 
-    data = struct.unpack('>1B1H1B', seq.read(4))
+    data = STRUCT_S16_U8.unpack_from(buf, arg_addr1)
 
-    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, msg_byte=data[0], arg_1=(data[1], 's16'), arg_2=(data[2], 'u8'))
+    return MessageData(arg_addr_1=arg_addr1, arg_addr_2=arg_addr2, arg_1=(data[0], 's16'), arg_2=(data[1], 'u8'))
 
 
-def write_bin(seq: str, addr: int, value: int) -> None:
+def write_bin(seq: mmap.mmap, addr: int, value: bytes) -> None:
     """ Writes the address and input value to the sequence binary """
-    seq.seek(addr)
-    seq.write(value)
+    seq[addr:addr + len(value)] = value
+
 
+def write_patches(seq: mmap.mmap, patches: list[tuple[int, bytes]]) -> None:
+    """ Writes a batch of address and value patches to the sequence binary in address order """
+    for addr, value in sorted(patches):
+        seq[addr:addr + len(value)] = value
 
-def auto_seq_edit(seq: str) -> None:
+
+def auto_seq_edit(seq: mmap.mmap) -> None:
     """ Initiates the default sequence editing process """
 
-    for addr in MSTR_VOL_ADDR:
-        input_vol = ARG_PARSER.check_input(ARG_PARSER.value)
-        write_bin(seq, addr, input_vol)
+    input_vol = ARG_PARSER.value
+    vol_string = int.from_bytes(input_vol, byteorder="big", signed=False)
 
-        hex_addr = format_addr(addr)
-        vol_string = int.from_bytes(input_vol, byteorder="big", signed=False)
+    write_patches(seq, [(addr, input_vol) for addr in MSTR_VOL_ADDR])
 
-        print(f'\n{BOLD}{GREEN_79}[SUCCESS]{RESET}:\n  Master volume at {PINK_218}{hex_addr.upper()}{RESET} successfully changed to: {PINK_218}{vol_string}{RESET} ({PINK_218}0x{hex(vol_string)[2:].upper()}{RESET})')
+    for addr in MSTR_VOL_ADDR:
+        print(get_vol_success_string(addr, vol_string))
 
 
-def manual_seq_edit(seq: str) -> None:
+def manual_seq_edit(seq: mmap.mmap) -> None:
     """ Initiates the manual sequence editing process """
 
     for addr in MSTR_VOL_ADDR:
@@ -283,30 +269,15 @@ def manual_seq_edit(seq: str) -> None:
             if type(input_vol) is bytes:
                 write_bin(seq, addr, input_vol)
 
-                hex_addr = format_addr(addr)
                 vol_string = int.from_bytes(
                     input_vol, byteorder="big", signed=False)
 
                 print(f'{PL}{CL}{PL}{CL}{PL}{CL}', end='', flush=True)
-                print(f'\n{BOLD}{GREEN_79}[SUCCESS]{RESET}:\n  Master volume at {PINK_218}{hex_addr}{RESET} successfully changed to: {PINK_218}{vol_string}{RESET} ({PINK_218}0x{hex(vol_string)[2:].upper()}{RESET})')
+                print(get_vol_success_string(addr, vol_string))
             else:
                 manual_vol = print(f'{PL}{CL}{PL}{CL}{PL}{CL}', message, end='', flush=True)
 
 
-def fix_jump(seq: str, addr: int) -> None:
-    """ Changes the jump message at the specified address to 0xFB """
-    seq.seek(addr)
-    b = b'\xFB'
-    seq.write(b)
-
-
-def fix_rjump(seq: str, addr: int) -> None:
-    """ Changes the jump message at the specified address to 0xF4 """
-    seq.seek(addr)
-    b = b'\xF4'
-    seq.write(b)
-
-
 @dataclass
 class SeqMessage:
     name: str
@@ -363,20 +334,51 @@ SEQ_MESSAGES = {
     0xC5: SeqMessage("scriptctr", read_u16, 3),
     0xC4: SeqMessage("callseq", read_u8x2, 3),
     0xC3: SeqMessage("mutechan", read_u16, 3, version_check=SeqVersion.MM),
-    0xC2: SeqMessage("unk_msg", lambda seq, addr: (None,), 3, version_check=SeqVersion.MM),
-
-    # ARGBITS
-    **{i: SeqMessage("testchan", read_msg, 1) for i in range(0x00, 0x10)},
-    **{i: SeqMessage("stopchan", read_msg, 1) for i in range(0x40, 0x50)},
-    **{i: SeqMessage("subio", read_msg, 1) for i in range(0x50, 0x60)},
-    **{i: SeqMessage("loadres", read_u8x2, 3) for i in range(0x60, 0x70)},
-    **{i: SeqMessage("storeio", read_msg, 1) for i in range(0x70, 0x80)},
-    **{i: SeqMessage("loadio", read_msg, 1) for i in range(0x80, 0x90)},
-    **{i: SeqMessage("loadchan", read_u16, 3) for i in range(0x90, 0xA0)},
-    **{i: SeqMessage("rloadchan", read_u16, 3) for i in range(0xA0, 0xB0)},
-    **{i: SeqMessage("loadseq", read_u8_u16, 4) for i in range(0xB0, 0xC0)}
+    0xC2: SeqMessage("unk_msg", read_unk, 3, version_check=SeqVersion.MM),
 }
 
+# ARGBITS messages, where the low nibble of the opcode is an argument
+SEQ_ARGBIT_MESSAGES = {
+    range(0x00, 0x10): SeqMessage("testchan", read_msg, 1),
+    range(0x40, 0x50): SeqMessage("stopchan", read_msg, 1),
+    range(0x50, 0x60): SeqMessage("subio", read_msg, 1),
+    range(0x60, 0x70): SeqMessage("loadres", read_u8x2, 3),
+    range(0x70, 0x80): SeqMessage("storeio", read_msg, 1),
+    range(0x80, 0x90): SeqMessage("loadio", read_msg, 1),
+    range(0x90, 0xA0): SeqMessage("loadchan", read_u16, 3),
+    range(0xA0, 0xB0): SeqMessage("rloadchan", read_u16, 3),
+    range(0xB0, 0xC0): SeqMessage("loadseq", read_u8_u16, 4),
+}
+
+# Dense per-opcode tables built from SEQ_MESSAGES and SEQ_ARGBIT_MESSAGES, indexed directly by opcode while parsing.
+# Each game version gets its own reader table, so opcodes outside its instruction set read as None.
+READ_FUNCS: dict[SeqVersion, list[Optional[Callable]]] = {version: [None] * 256 for version in GAME_VERSION}
+BYTE_SIZES = bytearray(256)  # A size of 0 means the size is determined by the message's argument
+MSG_PREFIXES: list[Optional[str]] = [None] * 256  # Color and padded name printed before a message
+MSG_SUFFIXES: list[Optional[str]] = [None] * 256  # Color reset printed after a message, if needed
+EXTRA_OUTPUT_LISTS: list[Optional[List]] = [None] * 256
+
+
+def fill_opcode_tables(opcodes: range, msg: SeqMessage) -> None:
+    """ Writes a message's attributes into the per-opcode tables for every opcode in the range """
+    count = len(opcodes)
+    slot = slice(opcodes.start, opcodes.stop)
+
+    for version in GAME_VERSION:
+        if msg.version_check is None or msg.version_check == version:
+            READ_FUNCS[version][slot] = [msg.read_func] * count
+    BYTE_SIZES[slot] = bytes((msg.byte_size or 0,)) * count
+    MSG_PREFIXES[slot] = [f'{msg.color or ""}  {msg.name.ljust(16)}'] * count
+    MSG_SUFFIXES[slot] = [RESET if msg.color else ''] * count
+    EXTRA_OUTPUT_LISTS[slot] = [msg.extra_output_list] * count
+
+
+for opcode, msg in SEQ_MESSAGES.items():
+    fill_opcode_tables(range(opcode, opcode + 1), msg)
+
+for opcodes, msg in SEQ_ARGBIT_MESSAGES.items():
+    fill_opcode_tables(opcodes, msg)
+
 
 class SysMsg:
     """ Holds functions for various system messages """
@@ -424,61 +426,53 @@ class ArgParser:
         """ Checks if the input filename's extension is .seq, .aseq, .zseq, .ootrs, or .mmrs """
         ext = os.path.splitext(filename)[1]
         if ext not in types:
-            ArgParser.parser.error('sequence filename must end with one of the following extensions: .seq, .zseq, .aseq')
+            raise argparse.ArgumentTypeError('sequence filename must end with one of the following extensions: .seq, .zseq, .aseq')
         return filename
 
-    def check_vol(value: str) -> int:
-        """ Checks if the input volume arg can be converted into an integer """
+    def check_vol(value: str) -> bytes:
+        """ Checks if the input volume arg can be converted into a volume byte """
         if value.endswith('%'):
             vol = float(value[:-1])
 
             if vol > 200 or vol < 0:
-                ArgParser.parser.error('volume percentage must be between 0% and 200%')
-            else:
-                return vol
+                raise argparse.ArgumentTypeError('volume percentage must be between 0% and 200%')
 
-        elif type(int(value, 0)) is int:
-            vol = int(value, 0)
+            return BYTE_VALUES[int(math.ceil(vol/100 * 127))]
 
-            if vol > 0xFF or vol < 0x00:
-                ArgParser.parser.error('volume value must be between 0 and 255 (or 0x00 and 0xFF)')
-            else:
-                return vol
+        vol = int(value, 0)
 
-    def check_input(self, value: str) -> bytes:
-        """ Converts the original input volume to a byte """
-        if isinstance(value, float):
-            result = int(math.ceil(value/100 * 127))
-            input_vol = result.to_bytes(1, byteorder='big', signed=False)
-        else:
-            input_vol = int(value).to_bytes(1, byteorder='big', signed=False)
+        if vol > 0xFF or vol < 0x00:
+            raise argparse.ArgumentTypeError('volume value must be between 0 and 255 (or 0x00 and 0xFF)')
 
-        return input_vol
+        return BYTE_VALUES[vol]
 
-    def convert_input(self, manual_vol: str) -> bytes:
-        """ Converts the manual input volume to a byte """
+    def convert_input(self, manual_vol: str) -> Optional[bytes]:
+        """ Converts the manual input volume to a byte, returns None if it is not a valid volume """
         try:
             if manual_vol.endswith('%'):
                 percent = float(manual_vol[:-1])
-                percent = int(math.ceil(percent/100 * 127))
-                input_vol = percent.to_bytes(1, byteorder='big', signed=False)
+                result = int(math.ceil(percent/100 * 127))
 
-            elif manual_vol.startswith('0x') or manual_vol.startswith('0X'):
-                input_vol = int(manual_vol, 0).to_bytes(1, byteorder='big', signed=False)
+            elif manual_vol.startswith(('0x', '0X')):
+                result = int(manual_vol, 16)
 
             else:
-                input_vol = int(manual_vol).to_bytes(1, byteorder='big', signed=False)
+                result = int(manual_vol)
 
-            return input_vol
-        except:
-            pass
+        except (ValueError, OverflowError):
+            return None
+
+        if 0x00 <= result <= 0xFF:
+            return BYTE_VALUES[result]
 
-    def get_args(self) -> None:
-        """ Gets the arguments from the CLI """
+        return None
+
+    def get_args(self, argv: Optional[List[str]] = None) -> None:
+        """ Gets the arguments from the CLI, or from argv when given """
 
         self.parser = argparse.ArgumentParser(
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            usage=f'{GRAY_248}[>_]{RESET} {YELLOW_229}python{RESET} {BLUE_39}{sys.argv[0]}{RESET} {GRAY_245}[-h]{RESET} {BLUE_39}[file] [volume]{RESET} {GRAY_245}[-j] [-g GAME]{RESET}',
+            usage=f'{GRAY_248}[>_]{RESET} {YELLOW_229}python{RESET} {BLUE_39}{sys.argv[0]}{RESET} {GRAY_245}[-h]{RESET} {BLUE_39}[file] [volume]{RESET} {GRAY_245}[-j] [-g GAME] [-a]{RESET}',
             description='''This script allows a user to change a Zelda64 music file's master volume.''',
         )
         self.parser.add_argument(
@@ -501,127 +495,144 @@ class ArgParser:
         self.parser.add_argument(
             '-g',
             '--game',
-            type=str,
+            type=str.upper,
             help="determines the instruction set the sequence was created to use",
             required=False,
             default='MM',
         )
-        self.args = self.parser.parse_args()
+        self.parser.add_argument(
+            '-a',
+            '--animate',
+            action='store_true',
+            help='use this arg to scroll the parsed sequence messages into the console one line at a time',
+            required=False,
+        )
+        self.args = self.parser.parse_args(argv)
 
         self.file = self.args.file
         self.value = self.args.volume
         self.fix_jumps = self.args.fix_jumps
+        self.animate = self.args.animate
         self.game_version = {
             'OOT': SeqVersion.OOT,
-            'OoT': SeqVersion.OOT,
-            'oot': SeqVersion.OOT,
             'MM': SeqVersion.MM,
-            'mm': SeqVersion.MM,
         }.get(self.args.game, None)
 
     def __str__(self) -> str:
-        return f'Parsed Arguments = (file={self.file}, volume={self.value}, fix_jumps={self.fix_jumps}, game_version={self.game_version})'
+        return f'Parsed Arguments = (file={self.file}, volume={self.value}, fix_jumps={self.fix_jumps}, game_version={self.game_version}, animate={self.animate})'
 
 
 class ArchiveHandler:
     """ Handle packing and unpacking archived files """
 
-    def unpack_archive(self, tempfolder) -> str:
-        """ Unpacks an .ootrs or .mmrs music file to a temp directory """
+    def __init__(self):
+        self.basefolder: str = os.path.dirname(os.path.realpath(__file__))
+        self.archive_path: str = os.path.abspath(ARG_PARSER.file)
+        self.filename, self.ext = os.path.splitext(ARG_PARSER.file)
+        self.seq_file: str = None
 
-        time.sleep(1.5)
+    def unpack_archive(self, tempfolder) -> str:
+        """ Unpacks the sequence file from an .ootrs or .mmrs music file to a temp directory """
 
-        filepath = os.path.abspath(ARG_PARSER.file)
+        self.seq_entry: str = None
 
-        with zipfile.ZipFile(filepath, 'r') as zip_archive:
-            zip_archive.extractall(tempfolder)
+        with zipfile.ZipFile(self.archive_path, 'r') as zip_archive:
+            self.entries: list[zipfile.ZipInfo] = zip_archive.infolist()
 
-        self.seq_file: str = None
+            for info in self.entries:
+                if info.filename.endswith(('.seq', '.aseq', '.zseq')):
+                    if self.seq_entry is None:
+                        self.seq_entry = info.filename
+                    else:
+                        raise Exception('Multiple sequence files detected! This should not happen!')
 
-        for f in os.listdir(tempfolder):
-            if f.endswith('.seq') or f.endswith('.aseq') or f.endswith('.zseq'):
-                if self.seq_file is None:
-                    self.seq_file = f'{tempfolder}/{f}'
-                else:
-                    raise Exception('Multiple sequence files detected! This should not happen!')
+            if self.seq_entry is not None:
+                self.seq_file = zip_archive.extract(self.seq_entry, tempfolder)
 
         return self.seq_file
 
-    def repack_archive(self, tempfolder):
-        """ Packs a temp directory into an .ootrs or .mmrs file """
-        basefolder = os.path.dirname(os.path.realpath(__file__))
+    def repack_archive(self):
+        """ Packs the edited sequence and the original archive's other files into an .ootrs or .mmrs file """
+        self.new_archive = f'{self.filename}.{datetime.datetime.now().strftime("%Y%m%d%H%M%S")}{self.ext}'
 
-        self.filename: str = os.path.splitext(ARG_PARSER.file)[0]
-        self.ext: str = os.path.splitext(ARG_PARSER.file)[1]
-
-        shutil.make_archive(self.filename, 'zip', tempfolder)
+        # Unchanged entries are streamed straight from the original archive with their ZipInfo intact
+        with zipfile.ZipFile(self.archive_path, 'r') as src_archive, \
+                zipfile.ZipFile(os.path.join(self.basefolder, self.new_archive), 'w', zipfile.ZIP_DEFLATED) as dst_archive:
+            for info in self.entries:
+                if info.filename == self.seq_entry:
+                    src = open(self.seq_file, 'rb')
+                else:
+                    src = src_archive.open(info)
 
-        self.new_archive = str(self.filename + f'.{datetime.datetime.now().strftime("%Y%m%d%H%M%S")}' + self.ext)
-        os.rename(self.filename + '.zip', f'{basefolder}/{self.new_archive}')
+                with src, dst_archive.open(info, 'w') as dst:
+                    shutil.copyfileobj(src, dst)
 
 
 class SeqParser:
     """ Parse Zelda64 binary sequence files """
 
+    __slots__ = ('pos', 'data', 'mm')
+
     def __init__(self):
         self.pos = 0
 
-    def open_sequence(self, seq: str) -> str:
-        """ Tries to open the specified file, if it cannot be opened throws an error """
+    def open_sequence(self, seq: str) -> mmap.mmap:
+        """ Tries to open and map the specified file, if it cannot be opened throws an error """
         try:
             self.data = open(seq, 'r+b')
-            return self.data
         except:
             print(f'{BOLD}{RED}[ERROR]{RESET}:\n  File could not be opened!')
             sys.exit(1)
 
-    def parse_seq(self, seq: str, version: SeqVersion) -> None:
-        """ Parses the SEQ section of a binary Zelda64 sequence file """
-
-        pos = self.pos
-        byte = seq.read(1)
-
-        # Give some time for the thread animation to actually play... because parsing does not take long at all
-        time.sleep(1.5)
+        try:
+            # An empty file cannot be mapped, so it is parsed as an empty buffer instead
+            if os.fstat(self.data.fileno()).st_size == 0:
+                self.mm = b''
+            else:
+                self.mm = mmap.mmap(self.data.fileno(), 0, access=mmap.ACCESS_WRITE)
+        except Exception as e:
+            self.data.close()
+            print(f'{BOLD}{RED}[ERROR]{RESET}:\n  File could not be mapped into memory! Exception: {e}')
+            sys.exit(1)
 
-        while (byte := seq.read(1)):
-            pos = seq.tell() - 1
-            opcode = byte[0]
+        return self.mm
 
-            msg = SEQ_MESSAGES.get(opcode)
-            if msg is None:
-                continue
+    def close_sequence(self) -> None:
+        """ Flushes any changes made to the mapped sequence and closes the file """
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.flush()
+            self.mm.close()
+        self.data.close()
 
-            if msg.version_check and msg.version_check != version:
-                continue
+    def parse_seq(self, buf: mmap.mmap, version: SeqVersion) -> None:
+        """ Parses the SEQ section of a binary Zelda64 sequence file """
 
-            seq.seek(pos + 1)
-            arglen = ord(seq.read(1))
+        pos = self.pos
+        end = len(buf)
+        read_funcs = READ_FUNCS[version]
 
-            if msg.read_func == read_argvar:
-                msg_data = msg.read_func(seq, pos, arglen)
-            else:
-                msg_data = msg.read_func(seq, pos)
+        while pos < end:
+            opcode = buf[pos]
 
-            if msg_data.arg_2:
-                msg_string = get_msg_string(pos, opcode, msg_data.arg_1, msg_data.arg_2)
-            else:
-                msg_string = get_msg_string(pos, opcode, msg_data.arg_1)
+            read_func = read_funcs[opcode]
+            if read_func is None:
+                pos += 1
+                continue
 
-            color_prefix = f'{msg.color}  ' if msg.color else "  "
-            msg_string = f'{color_prefix}{msg.name.ljust(16)}{msg_string}{RESET if msg.color else ""}'
+            msg_data = read_func(buf, pos)
 
-            SEQ_HEADER_OUTPUT.append(msg_string)
+            SEQ_HEADER_OUTPUT.append((opcode, pos, msg_data.arg_1, msg_data.arg_2))
 
-            if msg.extra_output_list is not None:
-                msg.extra_output_list.append(msg_data.arg_addr_1)
+            extra_output_list = EXTRA_OUTPUT_LISTS[opcode]
+            if extra_output_list is not None:
+                extra_output_list.append(msg_data.arg_addr_1)
                 if msg_data.arg_addr_2:
-                    msg.extra_output_list.append(msg_data.arg_addr_2)
+                    extra_output_list.append(msg_data.arg_addr_2)
 
             if opcode == 0xFF:
                 break
             else:
-                pos += msg.byte_size if msg.byte_size is not None else msg_data.pos
+                pos += BYTE_SIZES[opcode] or msg_data.pos
 
     def parse_chan(seq: str, version: SeqVersion) -> None:
         """ Parses the CHAN section of a binary Zelda64 sequence file """
@@ -649,23 +660,16 @@ def main() -> None:
     except Exception as e:
         SysMsg.file_open_failure(e)
     try:
-        msg_type = f'{BOLD}{YELLOW}[PARSING SEQUENCE]{RESET}:'
-        start_msg = 'Parsing SEQ section of sequence file to find messages...'
-        end_msg = f'{PL}{CL}{BOLD}{GREEN_79}[PARSING COMPLETED]{RESET}:\n  Parsing completed, listing messages in the SEQ section.'
-
-        # Create and start the thread
-        parser_thread = threading.Thread(target=sequence.parse_seq, args=(
-            sequence.data, ARG_PARSER.game_version))
-        start_thread(parser_thread, msg_type, start_msg, end_msg)
+        sequence.parse_seq(sequence.mm, ARG_PARSER.game_version)
+        print(f'{BOLD}{GREEN_79}[PARSING COMPLETED]{RESET}:\n  Parsing completed, listing messages in the SEQ section.')
 
         # Output the commands found in the sequence section
-        seq_parse_output(SEQ_HEADER_OUTPUT)
+        seq_parse_output(SEQ_HEADER_OUTPUT, ARG_PARSER.animate)
         # print(f'\n{BOLD}{YELLOW}[PARSING COMPLETED]{RESET}:\n  Parsing of sequence section completed.')
     except Exception as e:
         SysMsg.seq_parse_failure(e)
 
     if len(MSTR_VOL_ADDR) > 1:
-        answer: str = ''
         print(f'''
 {CYAN}[INFO]{RESET}:
   Multiple master volume messages have been found in the sequence.
@@ -674,25 +678,16 @@ def main() -> None:
   {ITALIC}Options: auto, manual, exit{RESET}
   Input: ''', end='')
 
-        options = [
-            'auto', 'Auto', 'AUTO',
-            'manual', 'Manual', 'MANUAL',
-            'exit', 'Exit', 'EXIT',
-        ]
+        options: dict[str, Callable] = {
+            'auto': auto_seq_edit,
+            'manual': manual_seq_edit,
+            'exit': lambda seq: SysMsg.exit_msg(),
+        }
 
-        while answer not in options:
-            answer = input()
+        while (option := options.get(input().lower())) is None:
+            print(f'{PL}{CL}  Input: ', end='', flush=True)
 
-            if answer in options[0:3]:
-                auto_seq_edit(seq)
-                break  # Return from loop after function completes — DO NOT REMOVE!
-            elif answer in options[3:6]:
-                manual_seq_edit(seq)
-                break  # Return from loop after function completes — DO NOT REMOVE!
-            elif answer in options[6:8]:
-                SysMsg.exit_msg()
-            else:
-                answer = print(f'{PL}{CL}  Input: ', end='', flush=True)
+        option(seq)
 
     elif MSTR_VOL_ADDR:
         auto_seq_edit(seq)
@@ -703,37 +698,57 @@ def main() -> None:
 
     if ARG_PARSER.fix_jumps:
         jump_types = [
-            ('eqjump', EQJUMP_ADDR, 'jump', fix_jump),
-            ('ltjump', LTJUMP_ADDR, 'jump', fix_jump),
-            ('gteqjump', GTEQJUMP_ADDR, 'jump', fix_jump),
-            ('reqjump', REQJUMP_ADDR, 'rjump', fix_rjump),
-            ('rltjump', RLTJUMP_ADDR, 'rjump', fix_rjump),
+            ('eqjump', EQJUMP_ADDR, 'jump', JUMP_MSG),
+            ('ltjump', LTJUMP_ADDR, 'jump', JUMP_MSG),
+            ('gteqjump', GTEQJUMP_ADDR, 'jump', JUMP_MSG),
+            ('reqjump', REQJUMP_ADDR, 'rjump', RJUMP_MSG),
+            ('rltjump', RLTJUMP_ADDR, 'rjump', RJUMP_MSG),
         ]
 
-        for label, addr_list, jump_type, fix_func in jump_types:
-            for addr in addr_list:
-                fix_func(seq, addr)
-                print(f'\n{BOLD}{GREEN_79}[SUCCESS]{RESET}:\n  {label} at {hex(addr)} successfully changed to: {jump_type}')
+        write_patches(seq, [
+            (addr, jump_msg)
+            for _, addr_list, _, jump_msg in jump_types
+            for addr in addr_list
+        ])
+
+        report_lines = [
+            f'\n{BOLD}{GREEN_79}[SUCCESS]{RESET}:\n  {label} at {hex(addr)} successfully changed to: {jump_type}'
+            for label, addr_list, jump_type, _ in jump_types
+            for addr in addr_list
+        ]
+
+        if report_lines:
+            sys.stdout.write('\n'.join(report_lines) + '\n')
 
         fixed_jumps = True
 
+    sequence.close_sequence()
+
+
+def _cli(argv: Optional[List[str]] = None) -> None:
+    """ Runs the editor from the CLI, or with argv in place of sys.argv """
+    global ARG_PARSER, archive, seq_file, no_vol, fixed_jumps
 
-if __name__ == '__main__':
     no_vol = False
     fixed_jumps = False
+    seq_file = None
+
+    # Clear anything left over from a previous sequence
+    for addr_list in (SEQ_HEADER_OUTPUT, MSTR_VOL_ADDR, JUMP_ADDR, EQJUMP_ADDR, LTJUMP_ADDR,
+                      GTEQJUMP_ADDR, RJUMP_ADDR, REQJUMP_ADDR, RLTJUMP_ADDR):
+        addr_list.clear()
 
-    ARG_PARSER: ArgParser = ArgParser()
-    ARG_PARSER.get_args()
+    ARG_PARSER = ArgParser()
+    ARG_PARSER.get_args(argv)
 
     if ARG_PARSER.game_version is None:
-        print(f'{RED}[ERROR]{RESET}:\n  Game argument must be one of the following values: OOT, OoT, oot, MM, or mm.')
+        print(f'{RED}[ERROR]{RESET}:\n  Game argument must be one of the following values (in any letter case): OOT or MM.')
         sys.exit(1)
 
     filepath = os.path.abspath(ARG_PARSER.file)
     filename = os.path.basename(ARG_PARSER.file)
 
-    archive: ArchiveHandler = ArchiveHandler()
-    archive.seq_file = None
+    archive = ArchiveHandler()
 
     try:
         if filepath.endswith('.ootrs') or filepath.endswith('.mmrs'):
@@ -744,25 +759,15 @@ if __name__ == '__main__':
             else:
                 ARG_PARSER.game_version = SeqVersion.MM
 
-            msg_type = f'{BOLD}{YELLOW}[UNPACKING ARCHIVE]{RESET}:'
-            start_msg = 'Unpacking the packed music files into a temp directory...'
-            end_msg = f'{PL}{CL}{BOLD}{GREEN_79}[ARCHIVE UNPACKED]{RESET}:'
-
             with tempfile.TemporaryDirectory() as tempfolder:
-                unpack_thread = threading.Thread(
-                    target=archive.unpack_archive, args=(tempfolder,))
-                start_thread(unpack_thread, msg_type, start_msg, end_msg)
-                print(f'  Music files in {PINK_218}{filename}{RESET} unpacked into temp directory, beginning parsing...\n')
+                archive.unpack_archive(tempfolder)
+                print(f'{BOLD}{GREEN_79}[ARCHIVE UNPACKED]{RESET}:')
+                print(f'  Sequence file in {PINK_218}{filename}{RESET} unpacked into temp directory, beginning parsing...\n')
 
                 main()
 
-                msg_type = f'\n{BOLD}{YELLOW}[PACKING ARCHIVE]{RESET}:'
-                start_msg = 'Repacking extracted files and deleting temp directory...'
-                end_msg = f'{PL}{CL}{BOLD}{GREEN_79}[ARCHIVE REPACKED]{RESET}:'
-
-                repack_thread = threading.Thread(
-                    target=archive.repack_archive, args=(tempfolder,))
-                start_thread(repack_thread, msg_type, start_msg, end_msg)
+                archive.repack_archive()
+                print(f'\n{BOLD}{GREEN_79}[ARCHIVE REPACKED]{RESET}:')
                 print(f'  A new {archive.ext} file has been created with your changes as {PINK_218}{os.path.basename(archive.new_archive)}{RESET}.')
 
         else:
@@ -777,3 +782,7 @@ if __name__ == '__main__':
     except Exception as e:
         print(f'ERROR: {e}')
         sys.exit(1)
+
+
+if __name__ == '__main__':
+    _cli()